@@ -0,0 +1,151 @@
+import os
+from datetime import timedelta
+
+import click
+from flask import Flask, g, session
+from sqlalchemy import event, insert, select
+from sqlalchemy.pool import QueuePool
+from flask_admin import Admin
+from flask_admin.contrib.sqla import ModelView
+from .auth import ph
+from .models import Course, Enrollment, Grade, TeacherCourse, User, db
+
+
+def create_app(test_config=None):
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev')
+    app.config['SQLALCHEMY_DATABASE_URI'] = (
+        'sqlite:///' + os.path.join(app.instance_path, 'enrollment.db'))
+    # Static assets get a long client-side cache, and when a fronting
+    # server is configured to honor X-Sendfile the kernel serves the file
+    # bodies instead of Python shuffling them through WSGI.
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = timedelta(hours=12)
+    app.config['USE_X_SENDFILE'] = os.environ.get('USE_X_SENDFILE') == '1'
+    if test_config:
+        app.config.update(test_config)
+
+    # Reuse connections across requests instead of the SQLite default of
+    # opening and closing one per request. Only for file-backed databases;
+    # in-memory test databases must stay on a single shared connection.
+    if app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite:///'):
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {
+            'poolclass': QueuePool,
+            # Sized for the documented 'gunicorn --threads 8' setup: keep
+            # the pool at or above the thread count per worker.
+            'pool_size': 8,
+            'max_overflow': 10,
+            'pool_pre_ping': True,
+            'connect_args': {'check_same_thread': False},
+        })
+
+    os.makedirs(app.instance_path, exist_ok=True)
+    db.init_app(app)
+
+    with app.app_context():
+        event.listen(db.engine, 'connect', _set_sqlite_pragmas)
+
+    admin = Admin(app, name='Enrollment Admin')
+    for model in (User, Course, Enrollment, TeacherCourse, Grade):
+        admin.add_view(ModelView(model, db.session, endpoint=model.__tablename__))
+
+    @app.before_request
+    def load_user():
+        # One identity-mapped lookup per request; handlers read
+        # g.current_user instead of re-fetching the session user.
+        g.current_user = (db.session.get(User, session['user_id'])
+                          if session.get('logged_in') else None)
+
+    from . import auth, routes
+    app.register_blueprint(auth.bp)
+    app.register_blueprint(routes.bp)
+
+    app.cli.add_command(init_db_command)
+    return app
+
+
+def _set_sqlite_pragmas(dbapi_conn, _record):
+    """Put SQLite in WAL mode with a relaxed fsync policy on every connect.
+
+    WAL lets student reads proceed while a grade write commits, and
+    synchronous=NORMAL means a commit fsyncs the WAL instead of the whole
+    database file.
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-64000')
+    cursor.close()
+
+
+def init_db():
+    """Drop everything and reload the sample roster."""
+    db.drop_all()
+    db.create_all()
+
+    # Keep courses.enrollment_count in step with the enrollments table so
+    # count reads stay O(1).
+    db.session.execute(db.text(
+        'CREATE TRIGGER IF NOT EXISTS enrollment_count_insert '
+        'AFTER INSERT ON enrollments BEGIN '
+        'UPDATE courses SET enrollment_count = enrollment_count + 1 '
+        'WHERE id = NEW.course_id; END'))
+    db.session.execute(db.text(
+        'CREATE TRIGGER IF NOT EXISTS enrollment_count_delete '
+        'AFTER DELETE ON enrollments BEGIN '
+        'UPDATE courses SET enrollment_count = enrollment_count - 1 '
+        'WHERE id = OLD.course_id; END'))
+    db.session.commit()
+
+    users = [
+        dict(username='admin', password=ph.hash('admin'),
+             name='Admin', role='admin'),
+        dict(username='hepworth', password=ph.hash('teacher'),
+             name='Ammon Hepworth', role='teacher'),
+        dict(username='walker', password=ph.hash('teacher'),
+             name='Susan Walker', role='teacher'),
+        dict(username='jose', password=ph.hash('student'),
+             name='Jose Santos', role='student'),
+        dict(username='betty', password=ph.hash('student'),
+             name='Betty Brown', role='student'),
+        dict(username='john', password=ph.hash('student'),
+             name='John Stuart', role='student'),
+        dict(username='li', password=ph.hash('student'),
+             name='Li Cheng', role='student'),
+        dict(username='nancy', password=ph.hash('student'),
+             name='Nancy Little', role='student'),
+    ]
+    courses = [
+        dict(name='Math 101', time='MWF 10:00-10:50 AM', capacity=8),
+        dict(name='Physics 121', time='TR 11:00-11:50 AM', capacity=10),
+        dict(name='CS 106', time='MWF 2:00-2:50 PM', capacity=10),
+        dict(name='CS 162', time='TR 3:00-3:50 PM', capacity=4),
+    ]
+    # Multi-row executemany inserts (insertmanyvalues) instead of per-object
+    # add_all + commit chains.
+    db.session.execute(insert(User), users)
+    db.session.execute(insert(Course), courses)
+
+    user_ids = dict(db.session.execute(select(User.username, User.id)).all())
+    course_ids = dict(db.session.execute(select(Course.name, Course.id)).all())
+    db.session.execute(insert(TeacherCourse), [
+        dict(teacher_id=user_ids['hepworth'], course_id=course_ids['Math 101']),
+        dict(teacher_id=user_ids['hepworth'], course_id=course_ids['CS 106']),
+        dict(teacher_id=user_ids['walker'], course_id=course_ids['Physics 121']),
+        dict(teacher_id=user_ids['walker'], course_id=course_ids['CS 162']),
+    ])
+
+    student_ids = db.session.execute(
+        select(User.id).where(User.role == 'student')).scalars().all()
+    db.session.execute(insert(Enrollment), [
+        dict(user_id=student_id, course_id=course_ids[course_name])
+        for student_id in student_ids
+        for course_name in ('Math 101', 'Physics 121')
+    ])
+    db.session.commit()
+
+
+@click.command('init-db')
+def init_db_command():
+    init_db()
+    click.echo('Initialized the database.')
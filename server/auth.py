@@ -0,0 +1,80 @@
+from functools import wraps
+
+from argon2 import PasswordHasher
+from argon2.exceptions import VerifyMismatchError
+from flask import Blueprint, abort, flash, g, redirect, render_template, request, session, url_for
+from sqlalchemy import lambda_stmt, select
+from werkzeug.security import check_password_hash
+
+from .models import User, db
+
+bp = Blueprint('auth', __name__)
+
+# Argon2id runs in native code; werkzeug's pbkdf2 default spends the same
+# work factor in a pure-Python HMAC loop.
+ph = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+
+
+def verify_password(user, password):
+    """Check a password, migrating legacy werkzeug hashes to argon2id."""
+    if user.password.startswith('$argon2'):
+        try:
+            ph.verify(user.password, password)
+        except VerifyMismatchError:
+            return False
+        if ph.check_needs_rehash(user.password):
+            user.password = ph.hash(password)
+            db.session.commit()
+        return True
+    if check_password_hash(user.password, password):
+        user.password = ph.hash(password)
+        db.session.commit()
+        return True
+    return False
+
+
+def role_required(*roles):
+    """Redirect anonymous users to login and 403 disallowed roles.
+
+    One wrapper layer instead of a login_required/role_required stack, and
+    it reads g.current_user (resolved once per request) rather than poking
+    the lazily-deserialized session cookie in each layer.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            if g.current_user is None:
+                return redirect(url_for('auth.login'))
+            if g.current_user.role not in roles:
+                abort(403)
+            return view(*args, **kwargs)
+        return wrapped
+    return decorator
+
+
+@bp.route('/login', methods=['GET', 'POST'])
+def login():
+    if request.method == 'POST':
+        username = request.form['username']
+        password = request.form['password']
+        # lambda_stmt caches the constructed statement across logins;
+        # only the username bind parameter changes per call.
+        stmt = lambda_stmt(lambda: select(User).where(User.username == username))
+        user = db.session.execute(stmt).scalar_one_or_none()
+        if user and verify_password(user, password):
+            session['logged_in'] = True
+            session['user_id'] = user.id
+            session['role'] = user.role
+            if user.role == 'student':
+                return redirect(url_for('routes.student_courses'))
+            if user.role == 'teacher':
+                return redirect(url_for('routes.teacher_courses'))
+            return redirect('/admin')
+        flash('Invalid username or password')
+    return render_template('login.html')
+
+
+@bp.route('/logout')
+def logout():
+    session.clear()
+    return redirect(url_for('auth.login'))
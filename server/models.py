@@ -0,0 +1,96 @@
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+
+
+class User(db.Model):
+    __tablename__ = 'users'
+
+    id = db.Column(db.Integer, primary_key=True)
+    username = db.Column(db.String(64), unique=True, index=True, nullable=False)
+    password = db.Column(db.String(256), nullable=False)
+    name = db.Column(db.String(128), nullable=False)
+    role = db.Column(db.String(16), nullable=False)  # 'student', 'teacher', or 'admin'
+
+    enrollments = db.relationship('Enrollment', back_populates='user',
+                                  cascade='all, delete-orphan')
+    teaching = db.relationship('TeacherCourse', back_populates='teacher',
+                               cascade='all, delete-orphan')
+
+    def __repr__(self):
+        return f'<User {self.username}>'
+
+
+class Course(db.Model):
+    __tablename__ = 'courses'
+
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(128), nullable=False)
+    time = db.Column(db.String(64), nullable=False)
+    capacity = db.Column(db.Integer, nullable=False)
+    # Maintained by AFTER INSERT/DELETE triggers on enrollments (see
+    # init_db), so count reads never need an aggregate scan.
+    enrollment_count = db.Column(db.Integer, nullable=False, default=0,
+                                 server_default='0')
+
+    enrollments = db.relationship('Enrollment', back_populates='course',
+                                  cascade='all, delete-orphan')
+    teachers = db.relationship('TeacherCourse', back_populates='course',
+                               cascade='all, delete-orphan')
+
+    def get_enrollment_count(self):
+        return self.enrollment_count
+
+    def is_full(self):
+        return self.enrollment_count >= self.capacity
+
+    def __repr__(self):
+        return f'<Course {self.name}>'
+
+
+class Enrollment(db.Model):
+    __tablename__ = 'enrollments'
+
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False)
+
+    user = db.relationship('User', back_populates='enrollments')
+    course = db.relationship('Course', back_populates='enrollments')
+    # One-to-one and cheap: always bring the grade along with its enrollment.
+    grade = db.relationship('Grade', back_populates='enrollment', uselist=False,
+                            cascade='all, delete-orphan', lazy='joined')
+
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'course_id', name='uq_enrollment_user_course'),
+        db.Index('ix_enrollment_user', 'user_id'),
+        db.Index('ix_enrollment_course', 'course_id'),
+    )
+
+
+class TeacherCourse(db.Model):
+    __tablename__ = 'teacher_courses'
+
+    id = db.Column(db.Integer, primary_key=True)
+    teacher_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    course_id = db.Column(db.Integer, db.ForeignKey('courses.id'), nullable=False)
+
+    teacher = db.relationship('User', back_populates='teaching')
+    course = db.relationship('Course', back_populates='teachers')
+
+    __table_args__ = (
+        db.UniqueConstraint('teacher_id', 'course_id', name='uq_teacher_course'),
+        db.Index('ix_teacher_course_teacher', 'teacher_id'),
+        db.Index('ix_teacher_course_course', 'course_id'),
+    )
+
+
+class Grade(db.Model):
+    __tablename__ = 'grades'
+
+    id = db.Column(db.Integer, primary_key=True)
+    enrollment_id = db.Column(db.Integer, db.ForeignKey('enrollments.id'),
+                              unique=True, nullable=False)
+    grade_value = db.Column(db.Float, nullable=True)
+
+    enrollment = db.relationship('Enrollment', back_populates='grade')
@@ -0,0 +1,221 @@
+from threading import Lock
+
+from cachetools import TTLCache
+from flask import (Blueprint, abort, flash, g, jsonify, redirect, render_template,
+                   request, url_for)
+from sqlalchemy import delete, exists, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import joinedload, selectinload
+
+from .auth import role_required
+from .models import Course, Enrollment, Grade, TeacherCourse, db
+
+bp = Blueprint('routes', __name__)
+
+# Enrollment counts are polled by the add-courses page; a few seconds of
+# staleness is acceptable, so most polls never touch the database.
+# TTLCache is not thread-safe, so every access takes the lock — we serve
+# from threaded gunicorn workers.
+_counts = TTLCache(maxsize=1024, ttl=5)
+_counts_lock = Lock()
+
+
+@bp.route('/')
+def index():
+    return redirect(url_for('auth.login'))
+
+
+@bp.route('/student/courses')
+@role_required('student')
+def student_courses():
+    user_id = g.current_user.id
+    enrollments = (Enrollment.query
+                   .options(selectinload(Enrollment.course), joinedload(Enrollment.grade))
+                   .filter_by(user_id=user_id).all())
+    courses_data = []
+    for enrollment in enrollments:
+        course = enrollment.course
+        grade = enrollment.grade
+        courses_data.append({
+            'id': course.id,
+            'name': course.name,
+            'time': course.time,
+            'grade': grade.grade_value if grade else None,
+        })
+    return render_template('student_courses.html', courses=courses_data)
+
+
+@bp.route('/student/add')
+@role_required('student')
+def student_add():
+    user_id = g.current_user.id
+    # One query returns each course (with its trigger-maintained count)
+    # plus a correlated EXISTS for whether this student is already in it.
+    rows = (db.session.query(
+                Course,
+                exists().where(Enrollment.user_id == user_id,
+                               Enrollment.course_id == Course.id))
+            .all())
+    courses_data = []
+    for course, already_enrolled in rows:
+        courses_data.append({
+            'id': course.id,
+            'name': course.name,
+            'time': course.time,
+            'capacity': course.capacity,
+            'enrolled': course.enrollment_count,
+            'is_full': course.is_full(),
+            'already_enrolled': bool(already_enrolled),
+        })
+    return render_template('student_add.html', courses=courses_data)
+
+
+@bp.route('/student/enroll/<int:course_id>', methods=['POST'])
+@role_required('student')
+def student_enroll(course_id):
+    user_id = g.current_user.id
+    course = db.get_or_404(Course, course_id)
+    # Capacity check and insert happen in one statement, so concurrent
+    # enrolls cannot race past the limit; the unique constraint catches a
+    # duplicate submit that slips between the NOT EXISTS and the insert.
+    stmt = text(
+        'INSERT INTO enrollments (user_id, course_id) '
+        'SELECT :user_id, :course_id '
+        'WHERE (SELECT enrollment_count < capacity FROM courses '
+        '       WHERE id = :course_id) '
+        'AND NOT EXISTS (SELECT 1 FROM enrollments '
+        '                WHERE user_id = :user_id AND course_id = :course_id)')
+    try:
+        result = db.session.execute(stmt, {'user_id': user_id, 'course_id': course_id})
+        db.session.commit()
+    except IntegrityError:
+        db.session.rollback()
+        flash(f'Already enrolled in {course.name}')
+        return redirect(url_for('routes.student_add'))
+    if result.rowcount:
+        with _counts_lock:
+            _counts.pop(course_id, None)
+        flash(f'Enrolled in {course.name}')
+    elif db.session.query(exists().where(Enrollment.user_id == user_id,
+                                         Enrollment.course_id == course_id)).scalar():
+        flash(f'Already enrolled in {course.name}')
+    else:
+        flash(f'{course.name} is full')
+    return redirect(url_for('routes.student_add'))
+
+
+@bp.route('/student/drop/<int:course_id>', methods=['POST'])
+@role_required('student')
+def student_drop(course_id):
+    user_id = g.current_user.id
+    # Delete by key instead of loading the Enrollment object first; the
+    # rowcount tells us whether there was anything to drop. The grade row
+    # has to go explicitly because bulk deletes bypass ORM cascades.
+    db.session.execute(
+        delete(Grade).where(Grade.enrollment_id.in_(
+            select(Enrollment.id).where(Enrollment.user_id == user_id,
+                                        Enrollment.course_id == course_id))))
+    result = db.session.execute(
+        delete(Enrollment).where(Enrollment.user_id == user_id,
+                                 Enrollment.course_id == course_id))
+    if result.rowcount == 0:
+        db.session.rollback()
+        abort(404)
+    db.session.commit()
+    with _counts_lock:
+        _counts.pop(course_id, None)
+    course_name = db.session.execute(
+        select(Course.name).where(Course.id == course_id)).scalar_one()
+    flash(f'Dropped {course_name}')
+    return redirect(url_for('routes.student_courses'))
+
+
+@bp.route('/teacher/courses')
+@role_required('teacher')
+def teacher_courses():
+    teacher_id = g.current_user.id
+    teacher_courses = (TeacherCourse.query
+                       .options(selectinload(TeacherCourse.course))
+                       .filter_by(teacher_id=teacher_id).all())
+    courses_data = []
+    for tc in teacher_courses:
+        course = tc.course
+        courses_data.append({
+            'id': course.id,
+            'name': course.name,
+            'time': course.time,
+            'capacity': course.capacity,
+            'enrolled': course.enrollment_count,
+        })
+    return render_template('teacher_courses.html', courses=courses_data)
+
+
+@bp.route('/teacher/course/<int:course_id>')
+@role_required('teacher')
+def teacher_course_detail(course_id):
+    teacher_id = g.current_user.id
+    course = db.get_or_404(Course, course_id)
+    # Authorization is fused into the data query: joining teacher_courses
+    # returns rows only for courses this teacher actually teaches.
+    enrollments = (Enrollment.query
+                   .join(TeacherCourse, TeacherCourse.course_id == Enrollment.course_id)
+                   .filter(TeacherCourse.teacher_id == teacher_id,
+                           Enrollment.course_id == course_id)
+                   .options(selectinload(Enrollment.user), joinedload(Enrollment.grade))
+                   .all())
+    if not enrollments and not db.session.query(
+            exists().where(TeacherCourse.teacher_id == teacher_id,
+                           TeacherCourse.course_id == course_id)).scalar():
+        abort(403)
+    students = []
+    for enrollment in enrollments:
+        grade = enrollment.grade
+        students.append({
+            'enrollment_id': enrollment.id,
+            'name': enrollment.user.name,
+            'grade': grade.grade_value if grade else None,
+        })
+    return render_template('teacher_course_detail.html', course=course, students=students)
+
+
+@bp.route('/teacher/grade/<int:enrollment_id>', methods=['POST'])
+@role_required('teacher')
+def teacher_edit_grade(enrollment_id):
+    teacher_id = g.current_user.id
+    enrollment = Enrollment.query.filter(
+        Enrollment.id == enrollment_id,
+        exists().where(TeacherCourse.teacher_id == teacher_id,
+                       TeacherCourse.course_id == Enrollment.course_id),
+    ).first()
+    if enrollment is None:
+        abort(404 if db.session.get(Enrollment, enrollment_id) is None else 403)
+    try:
+        grade_value = float(request.form['grade'])
+    except (KeyError, ValueError):
+        flash('Enter a numeric grade')
+        return redirect(url_for('routes.teacher_course_detail',
+                                course_id=enrollment.course_id))
+    # Single round trip: insert the grade row, or overwrite the value if
+    # one already exists for this enrollment.
+    db.session.execute(
+        sqlite_insert(Grade)
+        .values(enrollment_id=enrollment.id, grade_value=grade_value)
+        .on_conflict_do_update(index_elements=['enrollment_id'],
+                               set_={'grade_value': grade_value}))
+    db.session.commit()
+    return redirect(url_for('routes.teacher_course_detail', course_id=enrollment.course_id))
+
+
+@bp.route('/api/course/<int:course_id>/enrollment_count')
+def api_enrollment_count(course_id):
+    with _counts_lock:
+        count = _counts.get(course_id)
+    if count is None:
+        course = db.get_or_404(Course, course_id)
+        count = course.get_enrollment_count()
+        with _counts_lock:
+            _counts[course_id] = count
+    resp = jsonify({'course_id': course_id, 'enrollment_count': count})
+    resp.headers['Cache-Control'] = 'public, max-age=5'
+    return resp
@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import raiseload
+
+from server import create_app, init_db
+from server.models import db
+from server.routes import _counts
+
+
+@pytest.fixture
+def app():
+    app = create_app({
+        'SQLALCHEMY_DATABASE_URI': 'sqlite://',
+        'TESTING': True,
+        'SECRET_KEY': 'test',
+    })
+    _counts.clear()
+    with app.app_context():
+        init_db()
+
+        @event.listens_for(db.session, 'do_orm_execute')
+        def _raise_on_lazy_load(execute_state):
+            # Fail loudly if a handler traverses a relationship it did not
+            # eager-load; explicitly named loader options still win over
+            # the wildcard.
+            if execute_state.is_select and not execute_state.is_relationship_load:
+                execute_state.statement = execute_state.statement.options(raiseload('*'))
+
+    yield app
+
+    with app.app_context():
+        event.remove(db.session, 'do_orm_execute', _raise_on_lazy_load)
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def student_client(client):
+    client.post('/login', data={'username': 'jose', 'password': 'student'})
+    return client
+
+
+@pytest.fixture
+def teacher_client(client):
+    client.post('/login', data={'username': 'hepworth', 'password': 'teacher'})
+    return client
+
+
+@pytest.fixture
+def count_queries(app):
+    """Context manager collecting every SQL statement executed inside it."""
+    @contextmanager
+    def counter():
+        with app.app_context():
+            engine = db.engine
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', _record)
+
+    return counter
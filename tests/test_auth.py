@@ -0,0 +1,23 @@
+from werkzeug.security import generate_password_hash
+
+from server.models import User, db
+
+
+def test_legacy_hash_migrates_to_argon2_on_login(app, client):
+    with app.app_context():
+        user = User(username='legacy', password=generate_password_hash('oldpw'),
+                    name='Legacy User', role='student')
+        db.session.add(user)
+        db.session.commit()
+
+    resp = client.post('/login', data={'username': 'legacy', 'password': 'oldpw'})
+    assert resp.status_code == 302
+
+    with app.app_context():
+        migrated = User.query.filter_by(username='legacy').first()
+        assert migrated.password.startswith('$argon2')
+
+
+def test_wrong_password_rejected(app, client):
+    resp = client.post('/login', data={'username': 'jose', 'password': 'nope'})
+    assert b'Invalid username or password' in resp.data
@@ -0,0 +1,31 @@
+def test_student_courses_query_count(student_client, count_queries):
+    with count_queries() as statements:
+        resp = student_client.get('/student/courses')
+    assert resp.status_code == 200
+    # current user + enrollments (grades joined in) + selectin course
+    assert len(statements) == 3
+
+
+def test_student_add_query_count(student_client, count_queries):
+    with count_queries() as statements:
+        resp = student_client.get('/student/add')
+    assert resp.status_code == 200
+    # current user + one combined course/count/enrolled query
+    assert len(statements) == 2
+
+
+def test_teacher_course_detail_query_count(teacher_client, count_queries):
+    with count_queries() as statements:
+        resp = teacher_client.get('/teacher/course/1')
+    assert resp.status_code == 200
+    # current user + course + authorizing join (grades joined in) + selectin user
+    assert len(statements) == 4
+
+
+def test_api_enrollment_count_is_cached(client, count_queries):
+    first = client.get('/api/course/1/enrollment_count')
+    assert first.headers['Cache-Control'] == 'public, max-age=5'
+    with count_queries() as statements:
+        second = client.get('/api/course/1/enrollment_count')
+    assert second.get_json() == first.get_json()
+    assert statements == []
@@ -0,0 +1,14 @@
+from server.models import Enrollment, Grade
+
+
+def test_empty_grade_flashes_instead_of_crashing(app, teacher_client):
+    with app.app_context():
+        enrollment_id = Enrollment.query.filter_by(course_id=1).first().id
+
+    resp = teacher_client.post(f'/teacher/grade/{enrollment_id}',
+                               data={'grade': ''}, follow_redirects=True)
+    assert resp.status_code == 200
+    assert b'Enter a numeric grade' in resp.data
+
+    with app.app_context():
+        assert Grade.query.filter_by(enrollment_id=enrollment_id).first() is None